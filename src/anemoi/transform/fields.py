@@ -64,7 +64,10 @@ class NewDataField(WrappedField):
         data = self._data
         if dtype is not None:
             data = data.astype(dtype)
-        if flatten:
+            if flatten:
+                # `astype` already returned a copy, no need for another one
+                data = data.reshape(-1)
+        elif flatten:
             data = data.flatten()
         if index is not None:
             data = data[index]
@@ -162,9 +165,8 @@ class NewMetadataField(WrappedField):
         if kwargs.get("namespace"):
             assert len(args) == 0, (args, kwargs)
             mars = self._field.metadata(**kwargs).copy()
-            for k in list(mars.keys()):
-                if k in self._metadata:
-                    mars[k] = self._metadata[k]
+            for k in mars.keys() & self._metadata.keys():
+                mars[k] = self._metadata[k]
             return mars
 
         if len(args) == 1 and args[0] in self._metadata:
@@ -32,9 +32,13 @@ class MaskVariable(Filter):
         mask = ekd.from_source("file", path)[0].to_numpy().astype(bool)
 
         if threshold is not None:
-            self._mask = mask > threshold
+            mask = mask > threshold
         else:
-            self._mask = mask == mask_value
+            mask = mask == mask_value
+
+        # Indices of the masked points, so that each field only touches those
+        self._mask_indices = np.flatnonzero(mask)
+        self._mask_size = mask.size
 
         self._rename = rename
 
@@ -45,7 +49,10 @@ class MaskVariable(Filter):
         for field in data:
 
             values = field.to_numpy(flatten=True)
-            values[self._mask] = np.nan
+            if values.size != self._mask_size:
+                raise ValueError(f"Mask has {self._mask_size} points, but field {field} has {values.size}")
+
+            values[self._mask_indices] = np.nan
 
             if self._rename is not None:
                 param = field.metadata("param")
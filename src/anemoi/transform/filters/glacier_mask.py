@@ -15,8 +15,7 @@ from .base import SimpleFilter
 
 
 def mask_glaciers(snow_depth, glacier_mask):
-    snow_depth[glacier_mask] = np.nan
-    return snow_depth
+    return np.where(glacier_mask, np.nan, snow_depth)
 
 
 @filter_registry.register("glacier_mask")
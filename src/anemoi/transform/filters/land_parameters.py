@@ -48,8 +48,28 @@ VEG_TYPE_DIC = {
 }
 
 
-def read_crosswalking_table(param, param_dic):
-    arrays = [np.array([param_dic[x][key] for x in param]) for key in param_dic[0].keys()]
+def make_crosswalking_table(param_dic):
+    # The types are consecutive integers starting at 0, so each column of the
+    # table can be looked up for a whole field with a single fancy index
+    tables = [np.array([param_dic[x][key] for x in range(len(param_dic))]) for key in param_dic[0].keys()]
+    for table in tables:
+        table.setflags(write=False)
+    return tables
+
+
+SOIL_TYPE_TABLE = make_crosswalking_table(SOIL_TYPE_DIC)
+VEG_TYPE_TABLE = make_crosswalking_table(VEG_TYPE_DIC)
+
+
+def read_crosswalking_table(param, tables):
+    index = np.rint(param)
+
+    invalid = ~np.isclose(param, index) | (index < 0) | (index >= len(tables[0]))
+    if np.any(invalid):
+        raise ValueError(f"Invalid type codes {np.unique(param[invalid])}, expected integers in [0, {len(tables[0])})")
+
+    index = index.astype(int)
+    arrays = [table[index] for table in tables]
     return arrays
 
 
@@ -101,9 +121,9 @@ class LandParameters(SimpleFilter):
     def forward_transform(self, tvh, tvl, sotype):
         """Get static parameters from table based on soil/vegetation type"""
 
-        hveg_rsmin, hveg_cov, hveg_z0m = read_crosswalking_table(tvh.to_numpy(), VEG_TYPE_DIC)
-        lveg_rsmin, lveg_cov, lveg_z0m = read_crosswalking_table(tvl.to_numpy(), VEG_TYPE_DIC)
-        theta_pwp, theta_cap = read_crosswalking_table(sotype.to_numpy(), SOIL_TYPE_DIC)
+        hveg_rsmin, hveg_cov, hveg_z0m = read_crosswalking_table(tvh.to_numpy(), VEG_TYPE_TABLE)
+        lveg_rsmin, lveg_cov, lveg_z0m = read_crosswalking_table(tvl.to_numpy(), VEG_TYPE_TABLE)
+        theta_pwp, theta_cap = read_crosswalking_table(sotype.to_numpy(), SOIL_TYPE_TABLE)
 
         yield self.new_field_from_numpy(hveg_rsmin, template=tvh, param=self.hveg_rsmin)
         yield self.new_field_from_numpy(hveg_cov, template=tvh, param=self.hveg_cov)
@@ -7,6 +7,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import numpy as np
 
 from . import filter_registry
 from .base import SimpleFilter
@@ -39,14 +40,19 @@ class Rescale(SimpleFilter):
     def forward_transform(self, x):
         """x to ax+b"""
 
-        rescaled = x.to_numpy() * self.scale + self.offset
+        data = x.to_numpy()
+        rescaled = np.multiply(data, self.scale, dtype=np.result_type(data, self.scale, self.offset))
+        rescaled += self.offset
 
         yield self.new_field_from_numpy(rescaled, template=x, param=self.param)
 
     def backward_transform(self, x):
         """ax+b to x"""
 
-        descaled = (x.to_numpy() - self.offset) / self.scale
+        data = x.to_numpy()
+        # The division always returns floats, even for integer fields
+        descaled = np.subtract(data, self.offset, dtype=np.result_type(data, self.offset, self.scale, 1.0))
+        descaled /= self.scale
 
         yield self.new_field_from_numpy(descaled, template=x, param=self.param)
 
@@ -23,18 +23,13 @@ MAX_TP = 10000
 MAX_QI = 1
 
 
-def clip_opera(tp, quality):
-    tp[tp < 0] = 0
-    tp[tp >= MAX_TP] = MAX_TP
-    quality[quality >= MAX_QI] = MAX_QI
+def clip_opera(tp):
+    np.clip(tp, 0, MAX_TP, out=tp)
 
-    return tp, quality
+    return tp
 
 
 def mask_opera(tp, quality, mask):
-    print("✅✅", quality)
-    print("✅✅✅", tp)
-
     # # RAW HDF5 DATA FILTERING
     # tp[quality == NODATA] = np.nan
     # tp[quality == UNDETECTED] = np.nan
@@ -42,9 +37,7 @@ def mask_opera(tp, quality, mask):
     # GRIB2 ENCODED DATA FILTERING
     # !won't work until Pedro's fix to compute mask based on quality
     # quality grib2 just have nans no NODATA or UNDETECTED values
-    tp[mask == _NODATA] = np.nan
-    tp[mask == _UNDETECTED] = np.nan
-    tp[mask == _INF] = np.nan
+    tp[np.isin(mask, (_NODATA, _UNDETECTED, _INF))] = np.nan
 
     return tp
 
@@ -82,10 +75,10 @@ class RodeoOperaPreProcessing(SimpleFilter):
         """Pre-process Rodeo Opera data"""
 
         # 1st - apply masking
-        tp_masked = mask_opera(tp=tp.to_numpy(), quality=quality.to_numpy(), mask=mask.to_numpy())
+        tp_masked = mask_opera(tp=tp.to_numpy().copy(), quality=quality.to_numpy(), mask=mask.to_numpy())
 
         # 2nd - apply clipping
-        tp_cleaned, quality = clip_opera(tp=tp_masked, quality=quality.to_numpy())
+        tp_cleaned = clip_opera(tp=tp_masked)
 
         yield self.new_field_from_numpy(tp_cleaned, template=tp, param=self.tp_cleaned)
 
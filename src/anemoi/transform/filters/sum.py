@@ -43,7 +43,7 @@ class Sum(SimpleFilter):
         for arg in args:
             if total is None:
                 template = arg
-                total = template.to_numpy()
+                total = template.to_numpy().copy()
             else:
                 total += arg.to_numpy()
 
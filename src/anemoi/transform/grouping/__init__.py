@@ -22,6 +22,7 @@ class GroupByMarsParam:
         if not isinstance(params, (list, tuple)):
             params = [params]
         self.params = params
+        self._params = frozenset(params)
 
     def iterate(self, data, *, other=_lost):
 
@@ -32,7 +33,7 @@ class GroupByMarsParam:
             key = f.metadata(namespace="mars")
             param = key.pop("param")
 
-            if param not in self.params:
+            if param not in self._params:
                 other(f)
                 continue
 
@@ -57,7 +57,7 @@ class VariableFromMarsVocabulary(Variable):
 
         def __similarity(a, b):
             if isinstance(a, dict) and isinstance(b, dict):
-                return sum(__similarity(a[k], b[k]) for k in set(a.keys()) & set(b.keys()))
+                return sum(__similarity(a[k], b[k]) for k in a.keys() & b.keys())
 
             if isinstance(a, list) and isinstance(b, list):
                 return sum(__similarity(a[i], b[i]) for i in range(min(len(a), len(b))))
@@ -0,0 +1,48 @@
+# (C) Copyright 2024 Anemoi contributors.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from anemoi.transform.fields import new_field_from_numpy
+from anemoi.transform.filters import apply_mask
+from anemoi.transform.filters.apply_mask import MaskVariable
+
+MASK_VALUES = np.array([[0, 1, 0], [1, 0, 0]])
+
+
+class _MaskField:
+    def to_numpy(self):
+        return MASK_VALUES
+
+
+@pytest.fixture
+def mask_variable(monkeypatch):
+    monkeypatch.setattr(apply_mask, "ekd", SimpleNamespace(from_source=lambda *args, **kwargs: [_MaskField()]))
+    return MaskVariable(path="mask.grib", rename="masked")
+
+
+def test_apply_mask_2d(mask_variable):
+    values = np.arange(6, dtype=float)
+    field = new_field_from_numpy(values.reshape(2, 3), template=None, param="2t")
+
+    result = mask_variable.forward([field])
+
+    assert len(result) == 1
+    np.testing.assert_array_equal(result[0].to_numpy(), [0.0, np.nan, 2.0, np.nan, 4.0, 5.0])
+    assert result[0].metadata("param") == "2t_masked"
+
+
+def test_apply_mask_wrong_size(mask_variable):
+    field = new_field_from_numpy(np.arange(5, dtype=float), template=None, param="2t")
+
+    with pytest.raises(ValueError):
+        mask_variable.forward([field])
@@ -0,0 +1,25 @@
+# (C) Copyright 2024 Anemoi contributors.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import numpy as np
+import pytest
+
+from anemoi.transform.filters.glacier_mask import mask_glaciers
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_mask_glaciers(dtype):
+    snow_depth = np.array([0.1, 0.2, 0.3, 0.4], dtype=dtype)
+    glacier_mask = np.array([False, True, False, True])
+
+    result = mask_glaciers(snow_depth, glacier_mask)
+
+    assert result.dtype == dtype
+    np.testing.assert_array_equal(result, np.array([0.1, np.nan, 0.3, np.nan], dtype=dtype))
+    np.testing.assert_array_equal(snow_depth, np.array([0.1, 0.2, 0.3, 0.4], dtype=dtype))
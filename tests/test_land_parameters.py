@@ -0,0 +1,54 @@
+# (C) Copyright 2024 Anemoi contributors.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import numpy as np
+import pytest
+
+from anemoi.transform.filters.land_parameters import SOIL_TYPE_DIC
+from anemoi.transform.filters.land_parameters import SOIL_TYPE_TABLE
+from anemoi.transform.filters.land_parameters import VEG_TYPE_DIC
+from anemoi.transform.filters.land_parameters import VEG_TYPE_TABLE
+from anemoi.transform.filters.land_parameters import read_crosswalking_table
+
+
+def _expected(param, param_dic):
+    return [np.array([param_dic[x][key] for x in param.flatten()]).reshape(param.shape) for key in param_dic[0].keys()]
+
+
+@pytest.mark.parametrize(
+    "param_dic,tables",
+    [(VEG_TYPE_DIC, VEG_TYPE_TABLE), (SOIL_TYPE_DIC, SOIL_TYPE_TABLE)],
+    ids=["veg", "soil"],
+)
+@pytest.mark.parametrize("shape", [(12,), (3, 4)], ids=["1d", "2d"])
+def test_read_crosswalking_table(param_dic, tables, shape):
+    param = (np.arange(12) % len(param_dic)).astype(float).reshape(shape)
+
+    result = read_crosswalking_table(param, tables)
+
+    assert len(result) == len(param_dic[0])
+    for array, expected in zip(result, _expected(param, param_dic)):
+        assert array.shape == shape
+        np.testing.assert_array_equal(array, expected)
+
+
+def test_read_crosswalking_table_rounds_packed_codes():
+    result = read_crosswalking_table(np.array([2.9999998, 1.0000001]), VEG_TYPE_TABLE)
+    np.testing.assert_array_equal(result[0], [VEG_TYPE_DIC[3]["veg_rsmin"], VEG_TYPE_DIC[1]["veg_rsmin"]])
+
+
+@pytest.mark.parametrize("code", [-1.0, 21.0, 2.5, np.nan])
+def test_read_crosswalking_table_invalid_code(code):
+    with pytest.raises(ValueError):
+        read_crosswalking_table(np.array([1.0, code]), VEG_TYPE_TABLE)
+
+
+def test_crosswalking_tables_are_read_only():
+    with pytest.raises(ValueError):
+        VEG_TYPE_TABLE[0][0] = 0.0
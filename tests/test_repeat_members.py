@@ -8,64 +8,37 @@
 # nor does it submit to any jurisdiction.
 
 import earthkit.data as ekd
-import numpy as np
+import numpy.testing as npt
+import pytest
 
 from anemoi.transform.filters.repeat_members import RepeatMembers
 
 
-def _get_template():
+@pytest.fixture(scope="module")
+def template():
     temp = ekd.from_source("mars", {"param": "2t", "levtype": "sfc", "dates": ["2023-11-17 00:00:00"]})
     fieldlist = temp.to_fieldlist()
     return fieldlist, fieldlist[0].values, fieldlist[0].metadata
 
 
-def test_repeat_members_using_numbers_1():
-    fieldlist, values, metadata = _get_template()
-
-    repeat = RepeatMembers(numbers=[1, 2, 3])
-    repeated = repeat.forward(fieldlist)
-    assert len(repeated) == 3
-    for i, f in enumerate(repeated):
-        assert f.values.shape == values.shape
-        assert np.all(f.values == values)
-        assert f.metadata("number") == i + 1
-        assert f.metadata("name") == metadata("name")
-
-
-def test_repeat_members_using_numbers_2():
-    fieldlist, values, metadata = _get_template()
-
-    repeat = RepeatMembers(numbers="1/to/3")
-    repeated = repeat.forward(fieldlist)
-    assert len(repeated) == 3
-    for i, f in enumerate(repeated):
-        assert f.values.shape == values.shape
-        assert np.all(f.values == values)
-        assert f.metadata("number") == i + 1
-        assert f.metadata("name") == metadata("name")
-
-
-def test_repeat_members_using_members():
-    fieldlist, values, metadata = _get_template()
-
-    repeat = RepeatMembers(members=[0, 1, 2])
-    repeated = repeat.forward(fieldlist)
-    assert len(repeated) == 3
-    for i, f in enumerate(repeated):
-        assert f.values.shape == values.shape
-        assert np.all(f.values == values)
-        assert f.metadata("number") == i + 1
-        assert f.metadata("name") == metadata("name")
-
-
-def test_repeat_members_using_count():
-    fieldlist, values, metadata = _get_template()
-
-    repeat = RepeatMembers(count=3)
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(numbers=[1, 2, 3]),
+        dict(numbers="1/to/3"),
+        dict(members=[0, 1, 2]),
+        dict(count=3),
+    ],
+    ids=["using_numbers_1", "using_numbers_2", "using_members", "using_count"],
+)
+def test_repeat_members(template, kwargs):
+    fieldlist, values, metadata = template
+
+    repeat = RepeatMembers(**kwargs)
     repeated = repeat.forward(fieldlist)
     assert len(repeated) == 3
     for i, f in enumerate(repeated):
         assert f.values.shape == values.shape
-        assert np.all(f.values == values)
+        npt.assert_array_equal(f.values, values)
         assert f.metadata("number") == i + 1
         assert f.metadata("name") == metadata("name")
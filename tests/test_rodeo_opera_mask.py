@@ -0,0 +1,46 @@
+# (C) Copyright 2024 Anemoi contributors.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import importlib
+
+import numpy as np
+
+from anemoi.transform.fields import new_field_from_numpy
+
+rodeo = importlib.import_module("anemoi.transform.filters.rodeo-opera-mask")
+
+
+def test_mask_opera():
+    tp = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    mask = np.array([0, rodeo._NODATA, rodeo._UNDETECTED, rodeo._INF, 4])
+
+    result = rodeo.mask_opera(tp=tp, quality=None, mask=mask)
+
+    np.testing.assert_array_equal(result, [1.0, np.nan, np.nan, np.nan, 5.0])
+
+
+def test_clip_opera():
+    tp = np.array([-1.0, 0.0, 50.0, rodeo.MAX_TP + 1, np.nan])
+
+    result = rodeo.clip_opera(tp=tp)
+
+    np.testing.assert_array_equal(result, [0.0, 0.0, 50.0, rodeo.MAX_TP, np.nan])
+
+
+def test_forward_transform_leaves_inputs_unchanged():
+    tp = new_field_from_numpy(np.array([-1.0, 2.0, 3.0, 20000.0]), template=None, param="tp")
+    quality = new_field_from_numpy(np.array([0.5, 2.0, 0.5, 0.5]), template=None, param="quality")
+    mask = new_field_from_numpy(np.array([0.0, 0.0, rodeo._NODATA, 0.0]), template=None, param="mask")
+
+    (result,) = rodeo.RodeoOperaPreProcessing().forward_transform(tp, quality, mask)
+
+    np.testing.assert_array_equal(result.to_numpy(), [0.0, 2.0, np.nan, rodeo.MAX_TP])
+    assert result.metadata("param") == "tp_cleaned"
+    np.testing.assert_array_equal(tp.to_numpy(), [-1.0, 2.0, 3.0, 20000.0])
+    np.testing.assert_array_equal(quality.to_numpy(), [0.5, 2.0, 0.5, 0.5])
@@ -20,3 +20,33 @@ def test_snow_cover():
     expected_snow_cover = np.array([0.1, 0.4, 0.9])
     snow_cover = compute_snow_cover(snow_depth, snow_density)
     np.testing.assert_allclose(snow_cover, expected_snow_cover)
+
+
+def _reference_snow_cover(snow_depth, snow_density):
+    snow_cover = np.tanh((4000 * ((1000 * snow_depth) / snow_density)) / np.clip(snow_density, 100, 400))
+    return np.where(snow_cover > 0.99, 1.0, np.clip(snow_cover, 0, 1))
+
+
+def test_compute_snow_cover():
+    snow_depth = np.array([0.0, 1e-6, 1e-5, 5e-5, 1.0])
+    snow_density = np.array([50.0, 100.0, 250.0, 300.0, 500.0])
+    snow_cover = compute_snow_cover(snow_depth, snow_density)
+    np.testing.assert_allclose(snow_cover, _reference_snow_cover(snow_depth, snow_density))
+    assert snow_cover[0] == 0.0
+    assert snow_cover[-1] == 1.0
+
+
+@pytest.mark.parametrize(
+    "depth_dtype,density_dtype,expected_dtype",
+    [
+        (np.float32, np.float32, np.float32),
+        (np.float32, np.float64, np.float64),
+        (np.int64, np.float64, np.float64),
+    ],
+)
+def test_compute_snow_cover_dtype(depth_dtype, density_dtype, expected_dtype):
+    snow_depth = np.array([0, 1, 2], dtype=depth_dtype)
+    snow_density = np.array([100.0, 200.0, 300.0], dtype=density_dtype)
+    snow_cover = compute_snow_cover(snow_depth, snow_density)
+    assert snow_cover.dtype == expected_dtype
+    np.testing.assert_allclose(snow_cover, _reference_snow_cover(snow_depth, snow_density))
@@ -0,0 +1,26 @@
+# (C) Copyright 2024 Anemoi contributors.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import numpy as np
+
+from anemoi.transform.fields import new_field_from_numpy
+from anemoi.transform.filters.sum import Sum
+
+
+def test_sum_leaves_inputs_unchanged():
+    a = new_field_from_numpy(np.array([1.0, 2.0, 3.0]), template=None, param="a")
+    b = new_field_from_numpy(np.array([10.0, 20.0, 30.0]), template=None, param="b")
+    c = new_field_from_numpy(np.array([100.0, 200.0, 300.0]), template=None, param="c")
+
+    total = next(Sum(formula={"abc": ["a", "b", "c"]}).forward_transform(a, b, c))
+
+    np.testing.assert_array_equal(total.to_numpy(), [111.0, 222.0, 333.0])
+    assert total.metadata("param") == "abc"
+    np.testing.assert_array_equal(a.to_numpy(), [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(b.to_numpy(), [10.0, 20.0, 30.0])